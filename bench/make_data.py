@@ -0,0 +1,23 @@
+# Rebuilds data.npz from the timings listed in data.txt.
+# Each data line is `key = v0, v1, ...`; `#` starts a comment.
+
+import os
+import numpy
+
+def read_timings(path):
+    arrays = {}
+
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+
+            key, values = line.split("=", 1)
+            arrays[key.strip()] = numpy.array([int(v) for v in values.split(",")], dtype=numpy.int32)
+
+    return arrays
+
+if __name__ == "__main__":
+    here = os.path.dirname(os.path.abspath(__file__))
+    numpy.savez(os.path.join(here, "data.npz"), **read_timings(os.path.join(here, "data.txt")))
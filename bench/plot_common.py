@@ -0,0 +1,253 @@
+import os
+import sys
+import multiprocessing
+import numpy
+import svg_barplot
+
+# matplotlib is only loaded for PNG output; see `_pyplot`.
+_plt = None
+_SMALL_FONT = None
+
+# Below this many samples the JIT dispatch costs more than the arithmetic.
+_JIT_MIN_LEN = 32
+
+def _conf_stats_py(arr):
+    mean = sum(arr) / len(arr)
+    stddev = (sum((x - mean) ** 2 for x in arr) / len(arr)) ** 0.5
+    # conf = 0.95 * (stddev / math.sqrt(len(arr)))
+
+    return (mean, stddev)
+
+# Compiled on first use; False once numba turns out to be unavailable.
+_conf_stats_jit = None
+
+def _jit_kernel():
+    global _conf_stats_jit
+
+    if _conf_stats_jit is None:
+        try:
+            import numba
+        except ImportError:
+            _conf_stats_jit = False
+            return None
+
+        # Welford's single-pass mean/variance.
+        @numba.njit(numba.types.UniTuple(numba.float64, 2)(numba.float64[:]), cache=True)
+        def kernel(arr):
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+
+            for x in arr:
+                n += 1
+                d = x - mean
+                mean += d / n
+                m2 += d * (x - mean)
+
+            return (mean, (m2 / n) ** 0.5)
+
+        _conf_stats_jit = kernel
+
+    return _conf_stats_jit or None
+
+def conf_stats(arr):
+    if len(arr) < _JIT_MIN_LEN:
+        return _conf_stats_py(arr)
+
+    kernel = _jit_kernel()
+    if kernel is None:
+        return _conf_stats_py(arr)
+
+    return kernel(numpy.asarray(arr, dtype=numpy.float64))
+
+def _pyplot():
+    global _plt, _SMALL_FONT
+
+    if _plt is None:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from matplotlib.font_manager import FontProperties
+
+        # Plain ASCII bar charts: skip mathtext and render at screen resolution.
+        plt.rcParams.update({
+            'text.usetex': False,
+            'text.parse_math': False,
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000,
+            'savefig.dpi': 72,
+        })
+
+        _SMALL_FONT = FontProperties(size='small')
+        _plt = plt
+
+    return _plt
+
+def output_file(outdir, filename):
+    return os.path.join(outdir, filename)
+
+def is_svg(filename):
+    return filename.endswith(".svg")
+
+def _savefig(fig, outdir, filename):
+    fig.savefig(output_file(outdir, filename), bbox_inches=None, pil_kwargs={"compress_level": 1})
+
+    _pyplot().close(fig)
+
+_SIZE_LABELS = ['50k', '100k', '200k']
+
+def make_overview_plot(filename, title, noip_stats, ip_stats, outdir, ylim, size_labels=_SIZE_LABELS):
+    noip_means,noip_confs = zip(*noip_stats)
+    ip_means,ip_confs = zip(*ip_stats)
+
+    if is_svg(filename):
+        svg_barplot.vbar_groups([noip_means, ip_means], [noip_confs, ip_confs], \
+            ['no inner parallelism', 'inner parallelism'], size_labels, \
+            output_file(outdir, filename), ylim, title=title)
+        return
+
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(8,5))
+
+    ax.set_title(title)
+    ax.set_ylabel('Time (ms)', fontsize=12)
+
+    barwidth = 0.5
+    bargroupspacing = 1.5
+
+    x_noip = [i * (barwidth + bargroupspacing) for i in range(len(noip_stats))]
+    x_ip = [x + barwidth for x in x_noip]
+
+    b_noip = ax.bar(x_noip, noip_means, barwidth, color='r', yerr=noip_confs, ecolor='black', alpha=0.7)
+    b_ip = ax.bar(x_ip, ip_means, barwidth, color='b', yerr=ip_confs, ecolor='black', alpha=0.7)
+
+    # Ticks sit on the boundary between the two bars of each group.
+    ax.set_xticks(x_ip)
+    ax.set_xticklabels(size_labels, rotation='horizontal')
+
+    ax.legend([b_noip, b_ip], \
+        ('no inner parallelism', 'inner parallelism'), \
+        prop=_SMALL_FONT, loc='upper center', fancybox=True, shadow=True, ncol=2)
+   
+    ax.set_ylim([0,ylim])
+    _savefig(fig, outdir, filename)
+
+_ENTITY_LABELS = ["Fixed | no I.P.", "Fixed | I.P.", "Dynamic | no I.P.", "Dynamic | I.P."]
+_ENTITY_COLORS = ['r', 'b', 'r', 'b']
+
+def _entity_values(fixed_noip, fixed_ip, dynamic_noip, dynamic_ip):
+    fixed_noip_mean,fixed_noip_conf = fixed_noip
+    fixed_ip_mean,fixed_ip_conf = fixed_ip
+    dynamic_noip_mean,dynamic_noip_conf = dynamic_noip
+    dynamic_ip_mean,dynamic_ip_conf = dynamic_ip
+
+    values = [fixed_noip_mean,fixed_ip_mean,dynamic_noip_mean, dynamic_ip_mean]
+    errs = [fixed_noip_conf,fixed_ip_conf,dynamic_noip_conf, dynamic_ip_conf]
+
+    return (values, errs)
+
+def _plot_entity(ax, title, values, errs, xlim):
+    ax.set_title("Settings comparison - " + title)
+    ax.set_xlabel('Time (ms)', fontsize=12)
+    ax.set_xlim([0,xlim])
+
+    y_pos = list(range(len(values)))
+    ax.barh(y_pos, values, xerr=errs, align='center', color=_ENTITY_COLORS,  ecolor='black', alpha=0.7)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(_ENTITY_LABELS)
+
+def make_entity_plot(filename, title, fixed_noip, fixed_ip, dynamic_noip, dynamic_ip, outdir, xlim):
+    values,errs = _entity_values(fixed_noip, fixed_ip, dynamic_noip, dynamic_ip)
+
+    if is_svg(filename):
+        svg_barplot.hbar(values, errs, _ENTITY_LABELS, output_file(outdir, filename), xlim, \
+            title="Settings comparison - " + title, colors=_ENTITY_COLORS)
+        return
+
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(12,5))
+    _plot_entity(ax, title, values, errs, xlim)
+    _savefig(fig, outdir, filename)
+
+# Draws every entity comparison side by side in a single figure.
+# `sizes_data` is a list of `(title, fixed_noip, fixed_ip, dynamic_noip, dynamic_ip)`.
+def make_entity_combined(filename, sizes_data, outdir, xlim):
+    if is_svg(filename):
+        panels = []
+        for title, fixed_noip, fixed_ip, dynamic_noip, dynamic_ip in sizes_data:
+            values,errs = _entity_values(fixed_noip, fixed_ip, dynamic_noip, dynamic_ip)
+            panels.append(("Settings comparison - " + title, values, errs))
+
+        svg_barplot.hbar_panels(panels, _ENTITY_LABELS, output_file(outdir, filename), xlim, \
+            colors=_ENTITY_COLORS)
+        return
+
+    plt = _pyplot()
+    fig, axes = plt.subplots(1, len(sizes_data), sharex=True, sharey=True, figsize=(18,5))
+
+    for ax, (title, fixed_noip, fixed_ip, dynamic_noip, dynamic_ip) in zip(axes, sizes_data):
+        values,errs = _entity_values(fixed_noip, fixed_ip, dynamic_noip, dynamic_ip)
+        _plot_entity(ax, title, values, errs, xlim)
+
+    fig.subplots_adjust(left=0.08, right=0.98, wspace=0.08)
+    _savefig(fig, outdir, filename)
+
+def _job(task):
+    plot_fn, args = task
+    plot_fn(*args)
+
+def run_jobs(tasks):
+    workers = min(len(tasks), os.cpu_count() or 1)
+
+    if workers <= 1:
+        for task in tasks:
+            _job(task)
+        return
+
+    with multiprocessing.Pool(workers) as p:
+        p.map(_job, tasks)
+
+def _load_stats(data_prefix):
+    data = numpy.load(os.path.join(os.path.dirname(os.path.abspath(__file__)), "data.npz"))
+    stats = {}
+
+    for storage in ["dynamic", "fixed"]:
+        for mode in ["noip", "ip"]:
+            for size in _SIZE_LABELS:
+                key = "%s_%s_%s_%s" % (data_prefix, storage, mode, size)
+                stats[storage, mode, size] = conf_stats(data[key].tolist())
+
+    return stats
+
+# Entry point of the plot scripts. `data_prefix` selects their arrays in data.npz (see data.txt).
+# Pass --svg to write SVG files through svg_barplot instead of PNGs, and
+# --combined to draw the three entity comparisons as one figure.
+def main(title_prefix, data_prefix, outdir, limit):
+    ext = ".svg" if "--svg" in sys.argv[1:] else ".png"
+    combined = "--combined" in sys.argv[1:]
+
+    stats = _load_stats(data_prefix)
+    os.makedirs(outdir, exist_ok=True)
+
+    tasks = []
+
+    for storage in ["dynamic", "fixed"]:
+        tasks.append((make_overview_plot, ("ipcomp_" + storage + ext, \
+            "%s - %s entity storage" % (title_prefix, storage), \
+            [stats[storage, "noip", size] for size in _SIZE_LABELS], \
+            [stats[storage, "ip", size] for size in _SIZE_LABELS], \
+            outdir, limit)))
+
+    entities = [("%d entities" % count, \
+        stats["fixed", "noip", size], stats["fixed", "ip", size], \
+        stats["dynamic", "noip", size], stats["dynamic", "ip", size]) \
+        for size, count in zip(_SIZE_LABELS, [50000, 100000, 200000])]
+
+    if combined:
+        tasks.append((make_entity_combined, ("entity_all" + ext, entities, outdir, limit)))
+    else:
+        for size, entity in zip(_SIZE_LABELS, entities):
+            tasks.append((make_entity_plot, ("entity_" + size + ext,) + entity + (outdir, limit)))
+
+    run_jobs(tasks)
@@ -0,0 +1,140 @@
+# Minimal SVG writer for the benchmark bar charts.
+# Produces the same charts as the matplotlib path without importing it.
+
+from xml.sax.saxutils import escape
+
+_FONT = "font-family=\"sans-serif\""
+_COLORS = {'r': "red", 'b': "blue"}
+
+def _color(c):
+    return _COLORS.get(c, c)
+
+def _ticks(lim, count=5):
+    step = lim / count
+    return [i * step for i in range(count + 1)]
+
+def _fmt(v):
+    return "%d" % round(v)
+
+def _rect(out, x, y, w, h, color):
+    out.append("<rect x=\"%.2f\" y=\"%.2f\" width=\"%.2f\" height=\"%.2f\" fill=\"%s\" fill-opacity=\"0.7\"/>" \
+        % (x, y, w, h, _color(color)))
+
+def _line(out, x0, y0, x1, y1, width=1):
+    out.append("<line x1=\"%.2f\" y1=\"%.2f\" x2=\"%.2f\" y2=\"%.2f\" stroke=\"black\" stroke-width=\"%d\"/>" \
+        % (x0, y0, x1, y1, width))
+
+def _text(out, x, y, s, size=10, anchor="middle", extra=""):
+    out.append("<text x=\"%.2f\" y=\"%.2f\" font-size=\"%d\" text-anchor=\"%s\" %s%s>%s</text>" \
+        % (x, y, size, anchor, _FONT, (" " + extra) if extra else "", escape(s)))
+
+def _write(outpath, width, height, out):
+    with open(outpath, "w") as f:
+        f.write("<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"%d\" height=\"%d\" viewBox=\"0 0 %d %d\">\n" \
+            % (width, height, width, height))
+        f.write("<rect width=\"100%\" height=\"100%\" fill=\"white\"/>\n")
+        f.write("\n".join(out))
+        f.write("\n</svg>\n")
+
+# Draws one horizontal bar panel into `out`; `labels=None` leaves out the category labels.
+def _hbar_panel(out, values, errs, labels, xlim, title, xlabel, colors, width, height, left):
+    right, top, bottom = 30, 40, 50
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+    colors = colors or ['r'] * len(values)
+
+    _text(out, left + plot_w / 2, top - 14, title, size=14)
+
+    slot = plot_h / len(values)
+    barheight = slot * 0.8
+
+    for i, (v, e, c) in enumerate(zip(values, errs, colors)):
+        # First value at the bottom, as with plt.barh.
+        cy = top + slot * (len(values) - i - 0.5)
+        _rect(out, left, cy - barheight / 2, plot_w * v / xlim, barheight, c)
+
+        x0 = left + plot_w * (v - e) / xlim
+        x1 = left + plot_w * (v + e) / xlim
+        _line(out, x0, cy, x1, cy, 2)
+
+        if labels is not None:
+            _text(out, left - 6, cy + 4, labels[i], anchor="end")
+
+    for t in _ticks(xlim):
+        x = left + plot_w * t / xlim
+        _line(out, x, top + plot_h, x, top + plot_h + 4)
+        _text(out, x, top + plot_h + 16, _fmt(t))
+
+    _text(out, left + plot_w / 2, height - 10, xlabel, size=12)
+    out.append("<rect x=\"%d\" y=\"%d\" width=\"%d\" height=\"%d\" fill=\"none\" stroke=\"black\"/>" \
+        % (left, top, plot_w, plot_h))
+
+def hbar(values, errs, labels, outpath, xlim, title="", xlabel="Time (ms)", colors=None, width=864, height=360):
+    out = []
+    _hbar_panel(out, values, errs, labels, xlim, title, xlabel, colors, width, height, 130)
+    _write(outpath, width, height, out)
+
+# Side-by-side `hbar` panels sharing the category labels of the first one.
+# `panels` is a list of `(title, values, errs)`.
+def hbar_panels(panels, labels, outpath, xlim, xlabel="Time (ms)", colors=None, panel_width=432, height=360):
+    label_w = 130
+    width = label_w + panel_width * len(panels)
+
+    # Every panel keeps the same 10px left margin past the labels, so all share one x-scale.
+    panel_left = 10
+
+    out = []
+    for i, (title, values, errs) in enumerate(panels):
+        ox = 0 if i == 0 else label_w + panel_width * i
+        left = label_w + panel_left if i == 0 else panel_left
+
+        out.append("<g transform=\"translate(%d 0)\">" % ox)
+        _hbar_panel(out, values, errs, labels if i == 0 else None, xlim, title, xlabel, colors, \
+            left + panel_width - panel_left, height, left)
+        out.append("</g>")
+
+    _write(outpath, width, height, out)
+
+def vbar_groups(series, series_errs, series_labels, group_labels, outpath, ylim, title="", ylabel="Time (ms)", \
+    colors=None, width=576, height=360):
+    left, right, top, bottom = 70, 20, 40, 30
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+    colors = colors or ['r', 'b']
+
+    out = []
+    _text(out, width / 2, top - 14, title, size=14)
+
+    groupwidth = plot_w / len(group_labels)
+    barwidth = groupwidth * 0.8 / len(series)
+
+    for si, (values, errs, c) in enumerate(zip(series, series_errs, colors)):
+        for gi, (v, e) in enumerate(zip(values, errs)):
+            x = left + groupwidth * (gi + 0.1) + barwidth * si
+            h = plot_h * v / ylim
+            _rect(out, x, top + plot_h - h, barwidth, h, c)
+
+            cx = x + barwidth / 2
+            _line(out, cx, top + plot_h * (1 - (v - e) / ylim), cx, top + plot_h * (1 - (v + e) / ylim), 2)
+
+    for gi, label in enumerate(group_labels):
+        _text(out, left + groupwidth * (gi + 0.5), top + plot_h + 16, label)
+
+    for t in _ticks(ylim):
+        y = top + plot_h * (1 - t / ylim)
+        _line(out, left - 4, y, left, y)
+        _text(out, left - 6, y + 4, _fmt(t), anchor="end")
+
+    _text(out, 16, top + plot_h / 2, ylabel, size=12, extra="transform=\"rotate(-90 16 %.2f)\"" % (top + plot_h / 2))
+
+    # Legend, centered along the top edge of the axes.
+    lx = left + plot_w / 2 - 130 * len(series_labels) / 2
+    for i, (label, c) in enumerate(zip(series_labels, colors)):
+        x = lx + i * 130
+        _rect(out, x, top + 8, 16, 8, c)
+        _text(out, x + 20, top + 16, label, size=8, anchor="start")
+
+    out.append("<rect x=\"%d\" y=\"%d\" width=\"%d\" height=\"%d\" fill=\"none\" stroke=\"black\"/>" \
+        % (left, top, plot_w, plot_h))
+
+    _write(outpath, width, height, out)